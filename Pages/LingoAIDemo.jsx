@@ -14,6 +14,7 @@ const LingoAIDemo = () => {
   
   const messagesEndRef = useRef(null);
   const audioRef = useRef(null);
+  const audioQueueRef = useRef([]);
   const navigate = useNavigate();
 
   // Scroll to bottom of messages
@@ -91,11 +92,14 @@ const LingoAIDemo = () => {
           session_id: sessionId,
           language: language,
           proficiency: proficiency,
-          use_voice: useVoice
+          use_voice: useVoice,
+          stream: true
         })
       });
 
-      const data = await response.json();
+      // Replies stream as server-sent events; errors still come back as JSON
+      const isStream = response.headers.get('Content-Type')?.startsWith('text/event-stream');
+      const data = isStream ? await readChatStream(response) : await response.json();
       
       if (data.bot_response) {
         // Add bot response to chat
@@ -105,11 +109,6 @@ const LingoAIDemo = () => {
           timestamp: new Date()
         };
         setMessages(prev => [...prev, botMessageObj]);
-
-        // Play audio if available and voice is enabled
-        if (useVoice && data.audio_data) {
-          playAudio(data.audio_data);
-        }
       } else if (data.error) {
         setMessages(prev => [...prev, { 
           type: 'bot', 
@@ -129,11 +128,44 @@ const LingoAIDemo = () => {
     }
   };
 
-  const playAudio = (audioBase64) => {
+  // Read a streamed chat reply, queueing each sentence's audio as it arrives
+  const readChatStream = async (response) => {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let reply = {};
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) return reply;
+
+      buffer += decoder.decode(value, { stream: true });
+      const events = buffer.split('\n\n');
+      buffer = events.pop();
+
+      for (const event of events) {
+        if (!event.startsWith('data: ')) continue;
+        const data = JSON.parse(event.slice('data: '.length));
+        if (data.audio_url) queueAudio(data.audio_url);
+        if (data.done || data.error) reply = data;
+      }
+    }
+  };
+
+  // Play sentence audio chunks back to back
+  const queueAudio = (audioUrl) => {
+    audioQueueRef.current.push(audioUrl);
+    if (audioRef.current?.paused) playAudio();
+  };
+
+  const playAudio = () => {
+    const audioUrl = audioQueueRef.current.shift();
+    if (!audioUrl) return;
     try {
-      const audioSrc = `data:audio/wav;base64,${audioBase64}`;
+      const audioSrc = `http://localhost:5001${audioUrl}`;
       if (audioRef.current) {
         audioRef.current.src = audioSrc;
+        audioRef.current.onended = playAudio;
         audioRef.current.play().catch(e => console.log('Audio play failed:', e));
       }
     } catch (error) {
@@ -1,52 +1,168 @@
 import os
-import json
+import re
 import time
 import uuid
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+import hashlib
+import asyncio
+from collections import Counter, deque
+from itertools import islice
+from quart import Quart, Response, request, jsonify, send_file
+from quart.json.provider import DefaultJSONProvider
+from quart_cors import cors
+from cachetools import LRUCache, TTLCache
 from dotenv import load_dotenv
-import requests
-import base64
+import httpx
+import orjson
+from io import BytesIO
 
 # Load environment variables
 load_dotenv()
 
-app = Flask(__name__)
-CORS(app, resources={
-    r"/api/*": {
-        "origins": ["*"],
-        "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-        "allow_headers": ["Content-Type", "Authorization"]
-    }
-})
+# Shared Groq client so keep-alive connections are reused across chat turns
+_GROQ_CLIENT = httpx.AsyncClient(
+    base_url="https://api.groq.com/openai/v1",
+    headers={"Authorization": f"Bearer {os.getenv('GROQ_API_KEY')}"},
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+)
+# Caps in-flight Groq completions so bursts queue here instead of on the pool (see create_locks)
+_GROQ_SEM = None
+
+# Shared Deepgram client so TTS calls reuse keep-alive connections
+_DG_CLIENT = httpx.AsyncClient(
+    base_url="https://api.deepgram.com/v1",
+    timeout=15,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
 
-# Store user sessions
-user_sessions = {}
+# Synthesized audio for recurring phrases, keyed by (language, text digest);
+# bounded by total mp3 bytes rather than entry count
+_TTS_CACHE = LRUCache(maxsize=32 * 1024 * 1024, getsizeof=len)
+# Audio waiting to be fetched from /api/audio, keyed by blob id
+_AUDIO_BLOBS = TTLCache(maxsize=1024, ttl=300)
 
-class SimpleAITutor:
-    """Simplified AI tutor without LangChain dependencies"""
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster request/response (de)serialization"""
     
-    def __init__(self, language="English", proficiency="beginner"):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app = Quart(__name__)
+app.json = OrjsonProvider(app)
+app = cors(
+    app,
+    allow_origin="*",
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"]
+)
+
+# Splits streamed text after sentence-ending punctuation, keeping the whitespace
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])(\s+)')
+
+# Longest text spoken in one TTS request
+MAX_SPOKEN_CHARS = 500
+
+# Markdown-like formatting stripped before TTS: bold/italic, underline, links, code
+_MARKDOWN_RE = re.compile(
+    r'\*{1,2}(?P<bold>.*?)\*{1,2}'
+    r'|_{1,2}(?P<underline>.*?)_{1,2}'
+    r'|\[.*?\]\(.*?\)'
+    r'|`.*?`'
+)
+
+def _strip_markdown(match):
+    """Keep the text inside emphasis, drop links and code"""
+    inner = match.group('bold') or match.group('underline')
+    # Emphasis can wrap other formatting, e.g. **see `code`**
+    return _MARKDOWN_RE.sub(_strip_markdown, inner) if inner else ''
+
+# Emphasis/code markers that open or close a span: '*' only where it touches a word
+# on one side (so '2 * 3' and '2*3' stay), '_' only at a word edge, and any backticks
+_STRAY_MARKER_RE = re.compile(r'`+|(?<!\w)\*+(?=\w)|(?<=\w)\*+(?!\w)|(?<!\w)_+|_+(?!\w)')
+
+# '* ' list bullets at the start of a line
+_BULLET_RE = re.compile(r'^[ \t]*\*[ \t]+', re.MULTILINE)
+
+def _has_open_markdown(text):
+    """Whether text leaves an emphasis or code span unclosed"""
+    # Count marker runs the way clean_text strips them, so bullets, snake_case
+    # and '2 * 3' never hold a sentence back
+    runs = Counter(run[0] for run in _STRAY_MARKER_RE.findall(_BULLET_RE.sub('', text)))
+    return any(count % 2 for count in runs.values())
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Store user sessions, expiring each one 2 hours after it was created
+user_sessions = TTLCache(maxsize=10000, ttl=7200)
+# Guards user_sessions mutations across concurrent requests (see create_locks)
+sessions_lock = None
+
+@app.before_serving
+async def create_locks():
+    """Create asyncio primitives on the serving loop (Python 3.9 binds them to the loop at creation)"""
+    global sessions_lock, _GROQ_SEM
+    sessions_lock = asyncio.Lock()
+    _GROQ_SEM = asyncio.Semaphore(64)
+
+async def sweep_expired(interval=900):
+    """Free expired sessions and audio even when no requests arrive to trigger eviction"""
+    while True:
+        await asyncio.sleep(interval)
+        async with sessions_lock:
+            user_sessions.expire()
+        _AUDIO_BLOBS.expire()
+
+@app.before_serving
+async def start_sweeper():
+    """Run the expiry sweep every 15 minutes while serving"""
+    app.sweeper_task = asyncio.create_task(sweep_expired())
+
+@app.after_serving
+async def close_clients():
+    """Stop the expiry sweep and close pooled HTTP connections on shutdown"""
+    app.sweeper_task.cancel()
+    await _GROQ_CLIENT.aclose()
+    await _DG_CLIENT.aclose()
+
+class TutorEngine:
+    """Stateless AI tutor shared by all sessions (per-session state lives in user_sessions)"""
+    
+    def __init__(self):
         self.groq_api_key = os.getenv('GROQ_API_KEY')
-        self.language = language
-        self.proficiency = proficiency
-        
-        # Simple conversation memory (store last 5 exchanges)
-        self.memory = []
         
+        # Static prompt text per (language, proficiency); only the context changes between turns.
+        # Keys come from clients, so keep only the most recently used pairs
+        self._prompt_prefixes = LRUCache(maxsize=256)
+    
+    def new_session(self, language="English", proficiency="beginner"):
+        """Create the per-session state the engine works on"""
         if not self.groq_api_key:
             raise ValueError("GROQ_API_KEY not found in environment variables")
+        
+        return {
+            # Simple conversation memory (keeps the last 10 exchanges)
+            'memory': deque(maxlen=10),
+            'language': language,
+            'proficiency': proficiency,
+            'created_at': time.time()
+        }
     
-    def get_system_prompt(self):
-        """Generate system prompt based on language and proficiency"""
-        prompt = f"""You are Lingo AI, a friendly AI language tutor for {self.language} at {self.proficiency} level.
+    def get_prompt_prefix(self, language, proficiency):
+        """Get the static part of the system prompt"""
+        key = (language, proficiency)
+        prefix = self._prompt_prefixes.get(key)
+        if prefix is None:
+            prefix = self._prompt_prefixes[key] = f"""You are Lingo AI, a friendly AI language tutor for {language} at {proficiency} level.
 
 Your role:
-1. Help users learn {self.language}
+1. Help users learn {language}
 2. Correct grammar and vocabulary errors gently
 3. Provide explanations for language rules
 4. Have natural conversations
-5. Adapt to the user's proficiency level ({self.proficiency})
+5. Adapt to the user's proficiency level ({proficiency})
 
 Guidelines:
 - Keep responses concise (max 3-4 sentences)
@@ -55,76 +171,103 @@ Guidelines:
 - Give examples to illustrate points
 - Be encouraging and positive
 
-Current conversation context: {self.get_memory_context()}"""
-        return prompt
+Current conversation context: """
+        return prefix
+    
+    def render_prompt(self, language, proficiency, memory):
+        """Generate system prompt based on language, proficiency and memory"""
+        return self.get_prompt_prefix(language, proficiency) + self.get_memory_context(memory)
     
-    def get_memory_context(self):
+    def get_memory_context(self, memory):
         """Get recent conversation context"""
-        if not self.memory:
+        if not memory:
             return "This is the start of the conversation."
         
-        context = ""
-        for i, exchange in enumerate(self.memory[-3:]):  # Last 3 exchanges
-            context += f"\nUser: {exchange.get('user', '')}"
-            context += f"\nAI: {exchange.get('ai', '')}"
-        return context
+        return ''.join([
+            f"\nUser: {exchange.get('user', '')}\nAI: {exchange.get('ai', '')}"
+            for exchange in islice(memory, max(0, len(memory) - 3), None)  # Last 3 exchanges
+        ])
     
-    def add_to_memory(self, user_message, ai_response):
-        """Store conversation in memory"""
-        self.memory.append({
+    async def stream_response(self, session, user_message, on_sentence=None):
+        """Get AI response using Groq API directly, passing each completed sentence to on_sentence"""
+        # Prepare messages
+        messages = [
+            {
+                "role": "system",
+                "content": self.render_prompt(session['language'], session['proficiency'], session['memory'])
+            },
+            {
+                "role": "user",
+                "content": user_message
+            }
+        ]
+        
+        payload = {
+            "model": "llama-3.1-8b-instant",
+            "messages": messages,
+            "temperature": 0.7,
+            "max_tokens": 300,
+            "top_p": 1,
+            "stream": True,
+            "stop": None,
+        }
+        
+        # Call Groq API and read the server-sent token stream
+        tokens = []
+        pending = ""
+        held = ""
+        async with _GROQ_SEM:
+            async with _GROQ_CLIENT.stream("POST", "/chat/completions", json=payload) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[len("data: "):]
+                    if data == "[DONE]":
+                        break
+                    token = orjson.loads(data)["choices"][0]["delta"].get("content") or ""
+                    tokens.append(token)
+                    
+                    if on_sentence:
+                        pending += token
+                        *parts, pending = _SENTENCE_END_RE.split(pending)
+                        for sentence, separator in zip(parts[::2], parts[1::2]):
+                            # A span that never closes must not grow past what clean_text keeps
+                            if held and len(held) + len(sentence) > MAX_SPOKEN_CHARS:
+                                on_sentence(held)
+                                held = ""
+                            # Keep emphasis/code spans whole so clean_text can strip their markers
+                            held += sentence
+                            if _has_open_markdown(held):
+                                held += separator
+                            else:
+                                on_sentence(held)
+                                held = ""
+        
+        remainder = held + pending
+        if on_sentence and remainder.strip():
+            on_sentence(remainder)
+        
+        # Extract response
+        ai_response = "".join(tokens)
+        
+        # Store in memory
+        session['memory'].append({
             'user': user_message,
             'ai': ai_response
         })
-        # Keep only last 10 exchanges
-        if len(self.memory) > 10:
-            self.memory = self.memory[-10:]
-    
-    def clear_memory(self):
-        """Clear conversation memory"""
-        self.memory = []
+        
+        return ai_response.strip()
     
-    def get_response(self, user_message):
-        """Get AI response using Groq API directly"""
-        try:
-            # Import Groq here to avoid issues
-            from groq import Groq
-            
-            client = Groq(api_key=self.groq_api_key)
-            
-            # Prepare messages
-            messages = [
-                {
-                    "role": "system",
-                    "content": self.get_system_prompt()
-                },
-                {
-                    "role": "user",
-                    "content": user_message
-                }
-            ]
-            
-            # Call Groq API
-            completion = client.chat.completions.create(
-                model="llama-3.1-8b-instant",
-                messages=messages,
-                temperature=0.7,
-                max_tokens=300,
-                top_p=1,
-                stream=False,
-                stop=None,
-            )
-            
-            # Extract response
-            ai_response = completion.choices[0].message.content
-            
-            # Store in memory
-            self.add_to_memory(user_message, ai_response)
-            
-            return ai_response.strip()
-            
-        except Exception as e:
-            print(f"Error calling Groq API: {e}")
-            return f"I'm having trouble responding. Please try again. (Error: {str(e)})"
+tutor_engine = TutorEngine()
+
+# Deepgram voice per language; other languages use the English voice
+TTS_MODELS = {
+    "English": "aura-asteria-en",
+    "Spanish": "aura-2-estrella-es",
+    "French": "aura-athena-fr",
+    "German": "aura-orion-de"
+}
 
 class SimpleTTS:
     """Simplified Text-to-Speech using Deepgram"""
@@ -136,22 +279,15 @@ class SimpleTTS:
         if not self.api_key:
             print("Warning: DEEPGRAM_API_KEY not set. TTS will be disabled.")
     
-    def text_to_speech(self, text):
-        """Convert text to speech"""
+    async def text_to_speech(self, text):
+        """Convert text to speech, returning the URL the audio is served from"""
         if not self.api_key or not text.strip():
             return None
         
         # Select model based on language
-        models = {
-            "English": "aura-asteria-en",
-            "Spanish": "aura-2-estrella-es",
-            "French": "aura-athena-fr",
-            "German": "aura-orion-de"
-        }
-        
-        model = models.get(self.language, "aura-asteria-en")
+        model = TTS_MODELS.get(self.language, TTS_MODELS["English"])
         
-        url = f"https://api.deepgram.com/v1/speak?model={model}"
+        url = f"/speak?model={model}"
         headers = {
             "Authorization": f"Token {self.api_key}",
             "Content-Type": "application/json",
@@ -160,12 +296,19 @@ class SimpleTTS:
         # Clean text for TTS
         clean_text = self.clean_text(text)
         
+        # Skip Deepgram for phrases synthesized before
+        cache_key = (self.language, hashlib.sha1(clean_text.encode('utf-8')).hexdigest())
+        audio = _TTS_CACHE.get(cache_key)
+        if audio is not None:
+            return self.store_audio(audio)
+        
         payload = {"text": clean_text}
         
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = await _DG_CLIENT.post(url, headers=headers, json=payload)
             if response.status_code == 200:
-                return base64.b64encode(response.content).decode('utf-8')
+                _TTS_CACHE[cache_key] = response.content
+                return self.store_audio(response.content)
             else:
                 print(f"TTS Error {response.status_code}: {response.text}")
                 return None
@@ -173,81 +316,178 @@ class SimpleTTS:
             print(f"TTS Error: {e}")
             return None
     
+    def store_audio(self, audio):
+        """Hold audio briefly for the client to fetch"""
+        blob_id = uuid.uuid4().hex
+        _AUDIO_BLOBS[blob_id] = audio
+        return f"/api/audio/{blob_id}"
+    
     def clean_text(self, text):
         """Clean text for TTS"""
-        import re
-        
         # Remove markdown-like formatting
-        clean_text = re.sub(r'\*{1,2}(.*?)\*{1,2}', r'\1', text)  # Bold/Italic
-        clean_text = re.sub(r'_{1,2}(.*?)_{1,2}', r'\1', clean_text)  # Underline
-        clean_text = re.sub(r'\[.*?\]\(.*?\)', '', clean_text)  # Links
-        clean_text = re.sub(r'`.*?`', '', clean_text)  # Code
+        clean_text = _BULLET_RE.sub('', text)
+        clean_text = _MARKDOWN_RE.sub(_strip_markdown, clean_text)
+        clean_text = _STRAY_MARKER_RE.sub('', clean_text)
         
         # Remove excessive whitespace
-        clean_text = ' '.join(clean_text.split())
+        clean_text = _WHITESPACE_RE.sub(' ', clean_text).strip()
         
         # Limit length
-        if len(clean_text) > 500:
-            clean_text = clean_text[:497] + "..."
+        if len(clean_text) > MAX_SPOKEN_CHARS:
+            clean_text = clean_text[:MAX_SPOKEN_CHARS - 3] + "..."
         
         return clean_text.strip()
 
-def get_or_create_session(session_id, language="English", proficiency="beginner"):
+# One stateless TTS instance per Deepgram voice, shared by all sessions
+_TTS_INSTANCES = {}
+
+def get_tts(language):
+    """Get the shared TTS instance for a language"""
+    # Unsupported languages share the English voice, so the cache stays bounded by TTS_MODELS
+    if language not in TTS_MODELS:
+        language = "English"
+    if language not in _TTS_INSTANCES:
+        _TTS_INSTANCES[language] = SimpleTTS(language)
+    return _TTS_INSTANCES[language]
+
+async def get_or_create_session(session_id, language="English", proficiency="beginner"):
     """Get existing session or create new one"""
-    if session_id not in user_sessions:
-        user_sessions[session_id] = {
-            'ai_tutor': SimpleAITutor(language, proficiency),
-            'tts': SimpleTTS(language),
-            'created_at': time.time()
-        }
-    return user_sessions[session_id]
+    async with sessions_lock:
+        if session_id not in user_sessions:
+            user_sessions[session_id] = tutor_engine.new_session(language, proficiency)
+        return user_sessions[session_id]
+
+async def warm_up():
+    """Open pooled connections to the API providers ahead of the first chat turn"""
+    try:
+        await asyncio.gather(
+            _GROQ_CLIENT.get("/models"),
+            _DG_CLIENT.head("/")
+        )
+    except Exception as e:
+        print(f"Warm-up failed: {e}")
+
+# Health check endpoint (static, serialized once)
+_HEALTH_JSON = orjson.dumps({
+    'status': 'healthy',
+    'service': 'Lingo AI Backend',
+    'version': '1.0',
+    'python': '3.13'
+})
 
-# Health check endpoint
 @app.route('/api/health', methods=['GET'])
-def health_check():
+async def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'Lingo AI Backend',
-        'version': '1.0',
-        'python': '3.13'
-    })
+    return Response(_HEALTH_JSON, mimetype='application/json')
 
 # Chat endpoint
 @app.route('/api/chat', methods=['POST'])
-def chat():
+async def chat():
     """Handle chat messages"""
     try:
-        data = request.json
+        data = await request.get_json()
         user_message = data.get('message', '').strip()
         session_id = data.get('session_id')
         language = data.get('language', 'English')
         proficiency = data.get('proficiency', 'beginner')
         use_voice = data.get('use_voice', False)
+        stream = data.get('stream', False)
         
         if not user_message:
             return jsonify({'error': 'No message provided'}), 400
         
+        if not isinstance(language, str) or not isinstance(proficiency, str):
+            return jsonify({'error': 'language and proficiency must be strings'}), 400
+        
         if not session_id:
             session_id = str(uuid.uuid4())
         
         # Get or create session
-        session_data = get_or_create_session(session_id, language, proficiency)
-        ai_tutor = session_data['ai_tutor']
-        tts = session_data['tts']
+        session_data = await get_or_create_session(session_id, language, proficiency)
+        tts = get_tts(session_data['language'])
+        
+        # Reuse the connection a new session started warming up
+        if 'warm_up' in session_data:
+            await session_data['warm_up']
+        
+        def synthesize(sentence):
+            """Start TTS for a sentence if audio was requested"""
+            if not (use_voice and tts.api_key):
+                return None
+            return asyncio.create_task(tts.text_to_speech(sentence))
+        
+        if stream:
+            # Send each sentence and its audio as a server-sent event once ready
+            sentences = asyncio.Queue()
+            
+            audio_tasks = []
+            
+            def enqueue_sentence(sentence):
+                audio_task = synthesize(sentence)
+                if audio_task:
+                    audio_tasks.append(audio_task)
+                sentences.put_nowait((sentence, audio_task))
+            
+            async def events():
+                response_task = asyncio.create_task(tutor_engine.stream_response(session_data, user_message, enqueue_sentence))
+                response_task.add_done_callback(lambda _: sentences.put_nowait(None))
+                
+                try:
+                    while (item := await sentences.get()) is not None:
+                        sentence, audio_task = item
+                        audio_url = await audio_task if audio_task else None
+                        yield b"data: " + orjson.dumps({'text': sentence, 'audio_url': audio_url}) + b"\n\n"
+                    
+                    try:
+                        bot_response = await response_task
+                    except Exception as e:
+                        # Earlier sentences were already sent, so report the failure rather than replace them
+                        print(f"Error calling Groq API: {e}")
+                        yield b"data: " + orjson.dumps({'error': str(e)}) + b"\n\n"
+                        return
+                    
+                    yield b"data: " + orjson.dumps({
+                        'done': True,
+                        'session_id': session_id,
+                        'bot_response': bot_response,
+                        'language': language,
+                        'proficiency': proficiency
+                    }) + b"\n\n"
+                finally:
+                    # Stop generating and synthesizing if the client disconnected
+                    response_task.cancel()
+                    for audio_task in audio_tasks:
+                        audio_task.cancel()
+            
+            return Response(events(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+        
+        # Generate audio if requested, starting TTS as each sentence arrives
+        tts_tasks = []
+        
+        def collect_sentence(sentence):
+            tts_tasks.append(synthesize(sentence))
         
         # Get AI response
-        bot_response = ai_tutor.get_response(user_message)
+        try:
+            bot_response = await tutor_engine.stream_response(
+                session_data, user_message, collect_sentence if use_voice and tts.api_key else None
+            )
+        except Exception as e:
+            print(f"Error calling Groq API: {e}")
+            bot_response = f"I'm having trouble responding. Please try again. (Error: {str(e)})"
+            
+            # Speak only the apology, not the partial reply
+            for tts_task in tts_tasks:
+                tts_task.cancel()
+            apology_task = synthesize(bot_response)
+            tts_tasks = [apology_task] if apology_task else []
         
-        # Generate audio if requested
-        audio_data = None
-        if use_voice and tts.api_key:
-            audio_data = tts.text_to_speech(bot_response)
+        audio_urls = [url for url in await asyncio.gather(*tts_tasks) if url]
         
         return jsonify({
             'session_id': session_id,
             'bot_response': bot_response,
-            'audio_data': audio_data,
+            'audio_urls': audio_urls,
             'language': language,
             'proficiency': proficiency
         })
@@ -255,22 +495,32 @@ def chat():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Serve synthesized speech
+@app.route('/api/audio/<blob_id>', methods=['GET'])
+async def get_audio(blob_id):
+    """Serve TTS audio produced for a chat reply"""
+    audio = _AUDIO_BLOBS.get(blob_id)
+    if audio is None:
+        return jsonify({'error': 'Audio not found'}), 404
+    return await send_file(BytesIO(audio), mimetype='audio/mpeg', conditional=True)
+
 # Start new session
 @app.route('/api/session/new', methods=['POST'])
-def new_session():
+async def new_session():
     """Start a new chat session"""
     try:
-        data = request.json
+        data = await request.get_json()
         language = data.get('language', 'English')
         proficiency = data.get('proficiency', 'beginner')
         
+        if not isinstance(language, str) or not isinstance(proficiency, str):
+            return jsonify({'error': 'language and proficiency must be strings'}), 400
+        
         session_id = str(uuid.uuid4())
-        session_data = {
-            'ai_tutor': SimpleAITutor(language, proficiency),
-            'tts': SimpleTTS(language),
-            'created_at': time.time()
-        }
-        user_sessions[session_id] = session_data
+        session_data = await get_or_create_session(session_id, language, proficiency)
+        
+        # Hide the TLS handshake behind this round trip
+        session_data['warm_up'] = asyncio.create_task(warm_up())
         
         # Get welcome message
         welcome_msg = f"Hello! I'm your {language} tutor. I'll help you practice at the {proficiency} level. What would you like to learn today?"
@@ -288,14 +538,18 @@ def new_session():
 
 # Reset conversation
 @app.route('/api/session/reset', methods=['POST'])
-def reset_session():
+async def reset_session():
     """Reset conversation for current session"""
     try:
-        data = request.json
+        data = await request.get_json()
         session_id = data.get('session_id')
         
-        if session_id in user_sessions:
-            user_sessions[session_id]['ai_tutor'].clear_memory()
+        async with sessions_lock:
+            session_data = user_sessions.get(session_id)
+            if session_data is not None:
+                session_data['memory'].clear()
+        
+        if session_data is not None:
             return jsonify({'message': 'Conversation reset successfully'})
         else:
             return jsonify({'error': 'Session not found'}), 404
@@ -303,26 +557,28 @@ def reset_session():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-# Get available languages
+# Get available languages (static, serialized once)
+_LANGUAGES_JSON = orjson.dumps({
+    'languages': [
+        {'code': 'en', 'name': 'English', 'tts_supported': True},
+        {'code': 'es', 'name': 'Spanish', 'tts_supported': True},
+        {'code': 'fr', 'name': 'French', 'tts_supported': True},
+        {'code': 'de', 'name': 'German', 'tts_supported': True},
+        {'code': 'it', 'name': 'Italian', 'tts_supported': False},
+        {'code': 'jp', 'name': 'Japanese', 'tts_supported': False},
+        {'code': 'zh', 'name': 'Chinese', 'tts_supported': False},
+        {'code': 'ko', 'name': 'Korean', 'tts_supported': False}
+    ]
+})
+
 @app.route('/api/languages', methods=['GET'])
-def get_languages():
+async def get_languages():
     """Get available languages"""
-    return jsonify({
-        'languages': [
-            {'code': 'en', 'name': 'English', 'tts_supported': True},
-            {'code': 'es', 'name': 'Spanish', 'tts_supported': True},
-            {'code': 'fr', 'name': 'French', 'tts_supported': True},
-            {'code': 'de', 'name': 'German', 'tts_supported': True},
-            {'code': 'it', 'name': 'Italian', 'tts_supported': False},
-            {'code': 'jp', 'name': 'Japanese', 'tts_supported': False},
-            {'code': 'zh', 'name': 'Chinese', 'tts_supported': False},
-            {'code': 'ko', 'name': 'Korean', 'tts_supported': False}
-        ]
-    })
+    return Response(_LANGUAGES_JSON, mimetype='application/json')
 
 # Test endpoint
 @app.route('/api/test', methods=['GET'])
-def test_endpoint():
+async def test_endpoint():
     """Test if API is working"""
     return jsonify({
         'status': 'working',
@@ -330,33 +586,5 @@ def test_endpoint():
         'timestamp': time.time()
     })
 
-# Clean up old sessions (optional background task)
-def cleanup_old_sessions():
-    """Remove sessions older than 2 hours"""
-    current_time = time.time()
-    old_sessions = []
-    
-    for session_id, session_data in user_sessions.items():
-        if current_time - session_data['created_at'] > 7200:  # 2 hours
-            old_sessions.append(session_id)
-    
-    for session_id in old_sessions:
-        del user_sessions[session_id]
-    
-    if old_sessions:
-        print(f"Cleaned up {len(old_sessions)} old sessions")
-
-# Optional: Add a scheduled cleanup (if using a worker process)
-# import threading
-# def schedule_cleanup():
-#     threading.Timer(3600, schedule_cleanup).start()  # Run every hour
-#     cleanup_old_sessions()
-
-# if __name__ == '__main__':
-#     schedule_cleanup()
-#     app.run(debug=True, port=5001)
-
 if __name__ == '__main__':
-    # Run cleanup on startup
-    cleanup_old_sessions()
     app.run(debug=True, port=5001)